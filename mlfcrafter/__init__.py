@@ -1,22 +1,67 @@
-from .crafters import (
-    CategoricalCrafter,
-    CleanerCrafter,
-    DataIngestCrafter,
-    DeployCrafter,
-    ModelCrafter,
-    ScalerCrafter,
-    ScorerCrafter,
-)
-from .flow_chain import MLFChain
+import importlib
+from typing import TYPE_CHECKING
+
 from .utils import setup_logger
 
+if TYPE_CHECKING:
+    from .crafters import (
+        CategoricalCrafter,
+        CleanerCrafter,
+        DataIngestCrafter,
+        DeployCrafter,
+        FusedNumericCrafter,
+        ModelCrafter,
+        ScalerCrafter,
+        ScorerCrafter,
+    )
+    from .flow_chain import MLFChain, ParallelGroup
+
 __version__ = "0.1.1"
 
 # Setup default logger when MLFCrafter is imported
 _default_logger = setup_logger()
 
+# Public names resolved on first access (PEP 562), so importing one crafter
+# does not pull in sklearn, xgboost and joblib for all the others
+_LAZY = {
+    "MLFChain": ("mlfcrafter.flow_chain", "MLFChain"),
+    "ParallelGroup": ("mlfcrafter.flow_chain", "ParallelGroup"),
+    "DataIngestCrafter": (
+        "mlfcrafter.crafters.data_ingest_crafter",
+        "DataIngestCrafter",
+    ),
+    "CleanerCrafter": ("mlfcrafter.crafters.cleaner_crafter", "CleanerCrafter"),
+    "ScalerCrafter": ("mlfcrafter.crafters.scaler_crafter", "ScalerCrafter"),
+    "ModelCrafter": ("mlfcrafter.crafters.model_crafter", "ModelCrafter"),
+    "ScorerCrafter": ("mlfcrafter.crafters.scorer_crafter", "ScorerCrafter"),
+    "DeployCrafter": ("mlfcrafter.crafters.deploy_crafter", "DeployCrafter"),
+    "CategoricalCrafter": (
+        "mlfcrafter.crafters.categorical_crafter",
+        "CategoricalCrafter",
+    ),
+    "FusedNumericCrafter": (
+        "mlfcrafter.crafters.fused_numeric_crafter",
+        "FusedNumericCrafter",
+    ),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _LAZY[name]
+    value = getattr(importlib.import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "MLFChain",
+    "ParallelGroup",
     "DataIngestCrafter",
     "CleanerCrafter",
     "ScalerCrafter",
@@ -25,4 +70,5 @@ __all__ = [
     "DeployCrafter",
     "setup_logger",
     "CategoricalCrafter",
+    "FusedNumericCrafter",
 ]
@@ -0,0 +1,26 @@
+"""
+MLFCrafter pandas Compatibility Helpers
+=======================================
+
+Behaviour that differs across the supported pandas versions.
+"""
+
+import pandas as pd
+
+# Before pandas 3 (no copy-on-write), column selections are flagged as slices of
+# their parent and in-place writes to them raise SettingWithCopyWarning
+COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+
+def select_columns(df: pd.DataFrame, columns) -> pd.DataFrame:
+    """
+    Column subset of df that is safe to modify in place
+    Args:
+        df: DataFrame to select from
+        columns: Column labels to select
+    Returns:
+        A lazy copy under copy-on-write, an explicit copy before pandas 3
+    """
+    if COPY_ON_WRITE:
+        return df[columns]
+    return df[columns].copy()
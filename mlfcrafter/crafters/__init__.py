@@ -1,10 +1,40 @@
-from .categorical_crafter import CategoricalCrafter
-from .cleaner_crafter import CleanerCrafter
-from .data_ingest_crafter import DataIngestCrafter
-from .deploy_crafter import DeployCrafter
-from .model_crafter import ModelCrafter
-from .scaler_crafter import ScalerCrafter
-from .scorer_crafter import ScorerCrafter
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .categorical_crafter import CategoricalCrafter
+    from .cleaner_crafter import CleanerCrafter
+    from .data_ingest_crafter import DataIngestCrafter
+    from .deploy_crafter import DeployCrafter
+    from .fused_numeric_crafter import FusedNumericCrafter
+    from .model_crafter import ModelCrafter
+    from .scaler_crafter import ScalerCrafter
+    from .scorer_crafter import ScorerCrafter
+
+# Crafters are imported on first access (PEP 562)
+_LAZY = {
+    "DataIngestCrafter": ".data_ingest_crafter",
+    "CleanerCrafter": ".cleaner_crafter",
+    "ScalerCrafter": ".scaler_crafter",
+    "ModelCrafter": ".model_crafter",
+    "ScorerCrafter": ".scorer_crafter",
+    "DeployCrafter": ".deploy_crafter",
+    "CategoricalCrafter": ".categorical_crafter",
+    "FusedNumericCrafter": ".fused_numeric_crafter",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "DataIngestCrafter",
@@ -14,4 +44,5 @@ __all__ = [
     "ScorerCrafter",
     "DeployCrafter",
     "CategoricalCrafter",
+    "FusedNumericCrafter",
 ]
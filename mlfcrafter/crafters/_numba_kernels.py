@@ -0,0 +1,34 @@
+"""
+Numba kernels shared by the crafters.
+
+Importing this module imports numba, so crafters load it lazily on the first
+call that actually uses a kernel. Install numba with mlfcrafter[fast].
+"""
+
+from numba import njit, prange
+import numpy as np
+
+
+@njit(parallel=True, cache=True)
+def fill_nan_2d(arr, cols, fills):
+    """Replace NaNs in column cols[k] of arr with fills[k], in place"""
+    for k in prange(cols.shape[0]):
+        j = cols[k]
+        f = fills[k]
+        for i in range(arr.shape[0]):
+            if np.isnan(arr[i, j]):
+                arr[i, j] = f
+
+
+@njit(parallel=True, cache=True)
+def fill_and_scale_2d(arr, fills, offsets, scales):
+    """Replace NaNs with fills[j], then apply (x - offsets[j]) * scales[j]"""
+    for j in prange(arr.shape[1]):
+        f = fills[j]
+        o = offsets[j]
+        s = scales[j]
+        for i in range(arr.shape[0]):
+            x = arr[i, j]
+            if np.isnan(x):
+                x = f
+            arr[i, j] = (x - o) * s
@@ -1,10 +1,22 @@
+from importlib.util import find_spec
 import logging
+import numbers
+from typing import Optional
 
 import numpy as np
+import pandas as pd
 
 # Setup logger for this crafter
 logger = logging.getLogger("mlfcrafter.CleanerCrafter")
 
+# numba is optional, install with mlfcrafter[fast]. It is only imported, through
+# _numba_kernels, the first time a fill crosses _NUMBA_MIN_CELLS
+_HAS_NUMBA = find_spec("numba") is not None
+
+# Minimum number of cells in the frame before the numba kernel is used;
+# below this the JIT dispatch costs more than pandas' fillna
+_NUMBA_MIN_CELLS = 1_000_000
+
 
 class CleanerCrafter:
     """
@@ -27,6 +39,14 @@ class CleanerCrafter:
 
         str_fill (str): Fill value for categorical/string columns (default: "missing")
         int_fill (float): Fill value for numerical columns (default: 0.0)
+        category_threshold (Optional[float]): Convert object/string columns whose
+            unique-value ratio is below this threshold to category dtype before an
+            "auto" or "constant" fill (default: None, no conversion). Filling a
+            categorical column only writes integer codes and stores each distinct
+            string once, which is much faster and smaller for low-cardinality data.
+        inplace (bool): Fill missing values directly on the input DataFrame instead
+            of a copy (default: False). Inside an MLFChain the incoming frame is
+            owned by the chain, so the copy is skipped automatically.
 
     Context Input:
         - data (pd.DataFrame): Dataset to clean (required)
@@ -58,11 +78,18 @@ class CleanerCrafter:
     """
 
     def __init__(
-        self, strategy: str = "auto", str_fill: str = "missing", int_fill: float = 0.0
+        self,
+        strategy: str = "auto",
+        str_fill: str = "missing",
+        int_fill: float = 0.0,
+        category_threshold: Optional[float] = None,
+        inplace: bool = False,
     ):
         self.strategy = strategy
         self.str_fill = str_fill
         self.int_fill = int_fill
+        self.category_threshold = category_threshold
+        self.inplace = inplace
 
     def run(self, context: dict) -> dict:
         """
@@ -82,93 +109,159 @@ class CleanerCrafter:
         df = context["data"]
         logger.info(f"Input data shape: {df.shape}")
 
-        # Check for missing values
-        missing_counts = df.isnull().sum()
-        total_missing = missing_counts.sum()
-        logger.info(f"Total missing values found: {total_missing}")
-
-        if total_missing == 0:
+        # Check for missing values, counting only in columns that have any
+        has_nans = np.array([series.hasnans for _, series in df.items()], dtype=bool)
+        if not has_nans.any():
+            logger.info("Total missing values found: 0")
             logger.info("No missing values found, skipping cleaning")
             context["missing_values_handled"] = False
             return context
 
-        # Log missing values per column
-        for col, count in missing_counts[missing_counts > 0].items():
+        missing_counts = df.iloc[:, has_nans].isnull().sum()
+        logger.info(f"Total missing values found: {missing_counts.sum()}")
+        for col, count in missing_counts.items():
             logger.debug(f"Column '{col}': {count} missing values")
 
-        df_cleaned = df.copy()
-
-        for col in df_cleaned.columns:
-            if df_cleaned[col].isnull().sum() == 0:
-                continue
-            else:
-                if self.strategy == "auto":
-                    if df_cleaned[col].dtype == "object":
-                        logger.debug(
-                            f"Auto-filling categorical column '{col}' with '{self.str_fill}'"
-                        )
-                        df_cleaned[col] = df_cleaned[col].fillna(self.str_fill)
-                    else:
-                        logger.debug(
-                            f"Auto-filling numerical column '{col}' with {self.int_fill}"
-                        )
-                        df_cleaned[col] = df_cleaned[col].fillna(self.int_fill)
-
-                elif self.strategy == "mean":
-                    if np.issubdtype(df_cleaned[col].dtype, np.number):
-                        mean_val = df_cleaned[col].mean()
-                        logger.debug(
-                            f"Filling column '{col}' with mean value: {mean_val:.4f}"
-                        )
-                        df_cleaned[col] = df_cleaned[col].fillna(mean_val)
-
-                elif self.strategy == "median":
-                    if np.issubdtype(df_cleaned[col].dtype, np.number):
-                        median_val = df_cleaned[col].median()
-                        logger.debug(
-                            f"Filling column '{col}' with median value: {median_val:.4f}"
-                        )
-                        df_cleaned[col] = df_cleaned[col].fillna(median_val)
-
-                elif self.strategy == "mode":
-                    mode_val = df_cleaned[col].mode().iloc[0]
-                    logger.debug(f"Filling column '{col}' with mode value: {mode_val}")
-                    df_cleaned[col] = df_cleaned[col].fillna(mode_val)
-
-                elif self.strategy == "drop":
-                    original_rows = len(df_cleaned)
-                    df_cleaned = df_cleaned.dropna()
-                    dropped_rows = original_rows - len(df_cleaned)
-                    logger.debug(
-                        f"Dropped {dropped_rows} rows containing missing values"
-                    )
-
-                elif self.strategy == "constant":
-                    if df_cleaned[col].dtype == "object":
-                        logger.debug(
-                            f"Filling categorical column '{col}' with constant '{self.str_fill}'"
-                        )
-                        df_cleaned[col] = df_cleaned[col].fillna(self.str_fill)
-                    else:
-                        logger.debug(
-                            f"Filling numerical column '{col}' with constant {self.int_fill}"
-                        )
-                        df_cleaned[col] = df_cleaned[col].fillna(self.int_fill)
-
-                else:
-                    logger.error(f"Unsupported cleaning strategy: {self.strategy}")
-                    raise ValueError(f"Unsupported cleaning strategy: {self.strategy}")
+        inplace = self.inplace or context.get("_owns_data", False)
+        if df.columns.is_unique:
+            df_cleaned = self._clean(df, df.columns[has_nans], inplace)
+        else:
+            # Label lookups return frames for duplicated names, so clean a frame
+            # labelled by position and put the original labels back afterwards
+            logger.debug("Duplicate column names found, cleaning by position")
+            positional = df.set_axis(pd.RangeIndex(df.shape[1]), axis=1)
+            df_cleaned = self._clean(positional, positional.columns[has_nans], True)
+            df_cleaned.columns = df.columns
 
         # Update context
         context["data"] = df_cleaned
         context["cleaned_shape"] = df_cleaned.shape
         context["missing_values_handled"] = True
+        logger.info(f"Final data shape: {df_cleaned.shape}")
+
+        return context
+
+    def _clean(
+        self, df: pd.DataFrame, missing_cols: pd.Index, inplace: bool
+    ) -> pd.DataFrame:
+        """
+        Apply the cleaning strategy to a frame with unique column names
+        Args:
+            df: DataFrame to clean
+            missing_cols: Columns that contain at least one missing value, every
+                step is restricted to them
+            inplace: Whether df may be modified instead of copied
+        Returns:
+            Cleaned DataFrame
+        """
+        if self.strategy == "drop":
+            # Rows can only be dropped for NaNs in missing_cols, select the rest
+            # positionally to avoid dropna's full scan and index realignment
+            row_has_nan = df[missing_cols].isna().to_numpy().any(axis=1)
+            df_cleaned = df.iloc[~row_has_nan]
+            dropped_rows = len(df) - len(df_cleaned)
+            logger.debug(f"Dropped {dropped_rows} rows containing missing values")
+        else:
+            df_cleaned = df if inplace else df.copy()
+            if self.strategy in ("auto", "constant"):
+                self._prepare_categories(df_cleaned, missing_cols)
+            fill_map = self._build_fill_map(df_cleaned, missing_cols)
+            logger.debug(f"Fill values per column: {fill_map}")
+            if self.strategy in ("auto", "constant", "mean", "median"):
+                fill_map = self._fill_float_block(df_cleaned, fill_map)
+            df_cleaned.fillna(value=fill_map, inplace=True)
 
-        # Final verification
-        remaining_missing = df_cleaned.isnull().sum().sum()
+        # Final verification, counting only columns that still report NaNs
+        still_missing = [col for col in missing_cols if df_cleaned[col].hasnans]
+        remaining_missing = (
+            df_cleaned[still_missing].isnull().sum().sum() if still_missing else 0
+        )
         logger.info(
             f"Cleaning completed. Remaining missing values: {remaining_missing}"
         )
-        logger.info(f"Final data shape: {df_cleaned.shape}")
+        return df_cleaned
 
-        return context
+    def _prepare_categories(self, df: pd.DataFrame, missing_cols: pd.Index) -> None:
+        """
+        Make str_fill a valid category wherever it will be written
+        Args:
+            df: DataFrame being cleaned, modified in place
+            missing_cols: Columns that contain at least one missing value
+        """
+        string_cols = df[missing_cols].select_dtypes(include=["object", "string"])
+        for col in missing_cols:
+            series = df[col]
+            if (
+                self.category_threshold is not None
+                and col in string_cols.columns
+                and series.nunique(dropna=True) < self.category_threshold * len(series)
+            ):
+                logger.debug(f"Converting low-cardinality column '{col}' to category")
+                series = series.astype("category")
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                if self.str_fill not in series.cat.categories:
+                    series = series.cat.add_categories([self.str_fill])
+                df[col] = series
+
+    def _build_fill_map(self, df: pd.DataFrame, missing_cols: pd.Index) -> dict:
+        """
+        Compute fill values for all columns with missing values in one pass
+        Args:
+            df: DataFrame being cleaned
+            missing_cols: Columns that contain at least one missing value
+        Returns:
+            Mapping of column name to fill value, suitable for DataFrame.fillna
+        """
+        subset = df[missing_cols]
+        object_cols = subset.select_dtypes(
+            include=["object", "string", "category"]
+        ).columns
+        numeric_cols = subset.select_dtypes(include="number").columns
+
+        if self.strategy in ("auto", "constant"):
+            fill_map = dict.fromkeys(
+                missing_cols.difference(object_cols), self.int_fill
+            )
+            fill_map.update(dict.fromkeys(object_cols, self.str_fill))
+            return fill_map
+        elif self.strategy == "mean":
+            return subset[numeric_cols].mean().to_dict()
+        elif self.strategy == "median":
+            return subset[numeric_cols].median().to_dict()
+        elif self.strategy == "mode":
+            return subset.mode().iloc[0].to_dict()
+        else:
+            logger.error(f"Unsupported cleaning strategy: {self.strategy}")
+            raise ValueError(f"Unsupported cleaning strategy: {self.strategy}")
+
+    def _fill_float_block(self, df: pd.DataFrame, fill_map: dict) -> dict:
+        """
+        Fill a float64 frame in place with one parallel numba pass when possible
+        Args:
+            df: DataFrame being cleaned, modified in place
+            fill_map: Mapping of column name to fill value
+        Returns:
+            Remaining fill values for columns the kernel did not handle
+        """
+        if not _HAS_NUMBA or df.size < _NUMBA_MIN_CELLS:
+            return fill_map
+        if not (df.dtypes == np.float64).all() or not all(
+            isinstance(value, numbers.Real) for value in fill_map.values()
+        ):
+            return fill_map
+
+        # Only a single-block frame without copy-on-write (pandas < 3) exposes its
+        # data as a writeable view; anything else would fill a copy
+        arr = df.to_numpy(copy=False)
+        if not arr.flags.writeable or not np.shares_memory(
+            arr, df.iloc[:, 0].to_numpy()
+        ):
+            return fill_map
+
+        from ._numba_kernels import fill_nan_2d
+
+        logger.debug(f"Filling {len(fill_map)} float columns in place with numba")
+        cols = df.columns.get_indexer(list(fill_map))
+        fills = np.array(list(fill_map.values()), dtype=np.float64)
+        fill_nan_2d(arr, cols, fills)
+        return {}
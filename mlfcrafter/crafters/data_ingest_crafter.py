@@ -1,12 +1,46 @@
+from collections import OrderedDict
+from importlib.util import find_spec
 import logging
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import pandas as pd
 
 # Setup logger for this crafter
 logger = logging.getLogger("mlfcrafter.DataIngestCrafter")
 
+_PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split(".")[:2])
+
+# Faster parsers are used when installed, install with mlfcrafter[fast].
+# pandas accepts engine="calamine" from 2.2 on
+_HAS_PYARROW = find_spec("pyarrow") is not None
+_HAS_CALAMINE = find_spec("python_calamine") is not None and _PANDAS_VERSION >= (2, 2)
+
+# Accepted file extensions and reader method for each source type
+_EXT_MAP = {
+    "csv": (".csv",),
+    "excel": (".xls", ".xlsx"),
+    "json": (".json", ".jsonl"),
+}
+_READERS = {"csv": "_read_csv", "excel": "_read_excel", "json": "_read_json"}
+_SUFFIX_TYPES = {ext: kind for kind, exts in _EXT_MAP.items() for ext in exts}
+
+# Parsed DataFrames keyed by (resolved path, mtime_ns, size, reader options),
+# evicted least recently used first once their total size exceeds the cap.
+# Cached frames stay in memory until evicted or clear_cache() is called
+_INGEST_CACHE: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_INGEST_CACHE_MAXBYTES = 1 << 30
+
+# Shallow copies only stay isolated from the cached frame under copy-on-write,
+# which pandas enables unconditionally from 3.0. Before that every cache hit
+# and miss costs a deep copy, so the cache is off by default
+_SHALLOW_COPY_SAFE = _PANDAS_VERSION >= (3, 0)
+
+
+def _frame_bytes(data: pd.DataFrame) -> int:
+    return int(data.memory_usage(index=True, deep=False).sum())
+
 
 class DataIngestCrafter:
     """
@@ -20,14 +54,27 @@ class DataIngestCrafter:
         - CSV files (.csv)
         - Excel files (.xls, .xlsx)
         - JSON files (.json)
+        - JSON Lines files (.jsonl)
 
     Parameters:
-        data_path (Optional[str]): Path to the data file. Can be None if provided in context.
+        data_path (Optional[Union[str, os.PathLike]]): Path to the data file. Can be None
+            if provided in context.
         source_type (str): File format type. Options:
             - "auto": Automatically detect format from file extension (default)
             - "csv": Force CSV reading
             - "excel": Force Excel reading
             - "json": Force JSON reading
+        engine (str): Parser for CSV and JSON Lines files. Options:
+            - "c": pandas' built-in parsers, CSV read through a memory map (default)
+            - "pyarrow": Multi-threaded PyArrow parsers (requires pyarrow). Faster,
+              but date and datetime strings are parsed to dates instead of str
+        dtype_backend (Optional[str]): Backend for the resulting columns, passed to
+            the pandas reader ("numpy_nullable" or "pyarrow"). None keeps NumPy dtypes.
+        enable_cache (Optional[bool]): Reuse the parsed DataFrame when the same
+            unchanged file is ingested again. Files are matched by resolved path,
+            modification time and size. Cached frames are kept in memory, up to
+            1 GiB in total, until clear_cache() is called. None (default) enables
+            the cache on pandas >= 3 only, where hits share memory with the cache.
 
     Context Input:
         - data_path (Optional[str]): Alternative way to provide file path
@@ -53,9 +100,26 @@ class DataIngestCrafter:
         4. Add loaded data and metadata to context
     """
 
-    def __init__(self, data_path: Optional[str] = None, source_type: str = "auto"):
+    def __init__(
+        self,
+        data_path: Optional[Union[str, os.PathLike]] = None,
+        source_type: str = "auto",
+        engine: str = "c",
+        dtype_backend: Optional[str] = None,
+        enable_cache: Optional[bool] = None,
+    ):
         self.data_path = data_path
         self.source_type = source_type.lower()
+        self.engine = engine.lower()
+        if self.engine not in ("c", "pyarrow"):
+            raise ValueError(f"Unsupported engine: {engine}")
+        if self.engine == "pyarrow" and not _HAS_PYARROW:
+            raise ImportError(
+                "engine='pyarrow' requires pyarrow. "
+                "Install with: pip install mlfcrafter[fast]"
+            )
+        self.dtype_backend = dtype_backend
+        self.enable_cache = _SHALLOW_COPY_SAFE if enable_cache is None else enable_cache
 
     def run(self, context: dict) -> dict:
         """
@@ -81,10 +145,7 @@ class DataIngestCrafter:
         file = Path(str(data_path))
         suffix = file.suffix.lower()
 
-        if self.source_type == "auto":
-            logger.debug(f"Auto-detecting format from extension: {suffix}")
-            data = self._read_auto(file, suffix)
-        else:
+        if self.source_type != "auto":
             expected_ext = self._expected_extension(self.source_type)
             if suffix not in expected_ext:
                 logger.error(f"File extension mismatch: {suffix} not in {expected_ext}")
@@ -92,7 +153,21 @@ class DataIngestCrafter:
                     f"File extension and source type dont match:\n"
                     f" - File extension: {suffix}\n - Expected extension: {expected_ext}"
                 )
-            data = self._read_by_type(file, self.source_type)
+
+        cache_key = self._cache_key(file) if self.enable_cache else None
+        if cache_key is not None and cache_key in _INGEST_CACHE:
+            logger.debug("File unchanged since last ingestion, reusing cached data")
+            _INGEST_CACHE.move_to_end(cache_key)
+            data = _INGEST_CACHE[cache_key].copy(deep=not _SHALLOW_COPY_SAFE)
+        else:
+            if self.source_type == "auto":
+                logger.debug(f"Auto-detecting format from extension: {suffix}")
+                data = self._read_auto(file, suffix)
+            else:
+                data = self._read_by_type(file, self.source_type)
+
+            if cache_key is not None and self._cache_store(cache_key, data):
+                data = data.copy(deep=not _SHALLOW_COPY_SAFE)
 
         # Update context with loaded data
         context["data"] = data
@@ -105,33 +180,77 @@ class DataIngestCrafter:
 
         return context
 
-    def _expected_extension(self, source_type: str):
-        return {"csv": [".csv"], "excel": [".xls", ".xlsx"], "json": [".json"]}.get(
-            source_type, []
+    @staticmethod
+    def clear_cache():
+        """Drop all DataFrames cached by previous ingestions"""
+        _INGEST_CACHE.clear()
+        logger.debug("Ingestion cache cleared")
+
+    @staticmethod
+    def _cache_store(cache_key: tuple, data: pd.DataFrame) -> bool:
+        """Cache data unless it alone exceeds the size cap, evicting LRU entries"""
+        if _frame_bytes(data) > _INGEST_CACHE_MAXBYTES:
+            logger.debug("Data larger than the ingestion cache, not cached")
+            return False
+        _INGEST_CACHE[cache_key] = data
+        while sum(map(_frame_bytes, _INGEST_CACHE.values())) > _INGEST_CACHE_MAXBYTES:
+            _INGEST_CACHE.popitem(last=False)
+        return True
+
+    def _cache_key(self, file: Path) -> Optional[tuple]:
+        """Identify a file version by resolved path, mtime and size"""
+        try:
+            stat = file.stat()
+        except OSError:
+            return None
+        return (
+            str(file.resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.source_type,
+            self.engine,
+            self.dtype_backend,
         )
 
+    def _expected_extension(self, source_type: str):
+        return _EXT_MAP.get(source_type, ())
+
     def _read_by_type(self, file: Path, source_type: str):
-        if source_type == "csv":
-            logger.debug("Reading CSV file")
-            return pd.read_csv(file)
-        elif source_type == "excel":
-            logger.debug("Reading Excel file")
-            return pd.read_excel(file)
-        elif source_type == "json":
-            logger.debug("Reading JSON file")
-            return pd.read_json(file)
-        else:
+        if source_type not in _READERS:
             raise ValueError(f"Unsupported source type: {source_type}")
+        logger.debug(f"Reading {source_type} file")
+        return getattr(self, _READERS[source_type])(file)
 
     def _read_auto(self, file: Path, suffix: str):
-        if suffix == ".csv":
-            logger.debug("Auto-detected CSV format")
-            return pd.read_csv(file)
-        elif suffix in [".xls", ".xlsx"]:
-            logger.debug("Auto-detected Excel format")
-            return pd.read_excel(file)
-        elif suffix == ".json":
-            logger.debug("Auto-detected JSON format")
-            return pd.read_json(file)
-        else:
+        if suffix not in _SUFFIX_TYPES:
             raise ValueError(f"Unsupported source type: {suffix}")
+        logger.debug(f"Auto-detected {_SUFFIX_TYPES[suffix]} format")
+        return getattr(self, _READERS[_SUFFIX_TYPES[suffix]])(file)
+
+    def _reader_options(self) -> dict:
+        """Options shared by every pandas reader"""
+        if self.dtype_backend is None:
+            return {}
+        return {"dtype_backend": self.dtype_backend}
+
+    def _read_csv(self, file: Path) -> pd.DataFrame:
+        engine = self.engine
+        logger.debug(f"Using {engine} CSV engine")
+        options = self._reader_options()
+        if engine == "c":
+            # Let the OS page the file in instead of buffering it through Python I/O
+            options["memory_map"] = True
+        return pd.read_csv(file, engine=engine, **options)
+
+    def _read_excel(self, file: Path) -> pd.DataFrame:
+        # calamine parses .xls and .xlsx natively in Rust, much faster than openpyxl
+        engine = "calamine" if _HAS_CALAMINE else None
+        return pd.read_excel(file, engine=engine, **self._reader_options())
+
+    def _read_json(self, file: Path) -> pd.DataFrame:
+        if file.suffix.lower() == ".jsonl":
+            engine = "pyarrow" if self.engine == "pyarrow" else "ujson"
+            return pd.read_json(
+                file, lines=True, engine=engine, **self._reader_options()
+            )
+        return pd.read_json(file, **self._reader_options())
@@ -0,0 +1,275 @@
+from importlib.util import find_spec
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
+from .._compat import select_columns
+from .cleaner_crafter import _NUMBA_MIN_CELLS, CleanerCrafter
+from .scaler_crafter import ScalerCrafter, _numerical_columns
+
+# Setup logger for this crafter
+logger = logging.getLogger("mlfcrafter.FusedNumericCrafter")
+
+# numba is optional, install with mlfcrafter[fast]. It is only imported, through
+# _numba_kernels, the first time the scaled block reaches _NUMBA_MIN_CELLS
+_HAS_NUMBA = find_spec("numba") is not None
+
+
+class FusedNumericCrafter:
+    """
+    Fused Cleaning and Scaling Crafter for numerical features.
+
+    This crafter produces the same result as running CleanerCrafter followed by
+    ScalerCrafter, but fills and scales the numerical columns in a single pass over
+    the data instead of two. Column statistics of the filled data are derived from
+    the statistics of the observed values, so the filled frame is never scanned
+    again. Columns that are not scaled (target, non-numerical) are cleaned by a
+    regular CleanerCrafter.
+
+    Parameters:
+        fill (str): Missing value strategy, as in CleanerCrafter. Options:
+            - "auto" / "constant": Fill numerical columns with int_fill
+            - "mean": Fill numerical columns with column mean
+            - "median": Fill numerical columns with column median
+        scaler_type (str): Scaling technique, as in ScalerCrafter. Options:
+            - "standard": Standardize features (mean=0, std=1)
+            - "minmax": Scale features to [0,1] range
+        columns (Optional[List[str]]): Specific columns to scale.
+            - None: Auto-select all numerical columns except target (default)
+        str_fill (str): Fill value for categorical/string columns (default: "missing")
+        int_fill (float): Fill value for numerical columns (default: 0.0)
+        category_threshold (Optional[float]): Passed to CleanerCrafter
+        dtype (numpy dtype): Precision of the scaled columns (default: np.float64)
+        inplace (bool): Modify the input DataFrame instead of a copy (default: False)
+
+    Context Input:
+        - data (pd.DataFrame): Dataset to clean and scale (required)
+        - target_column (Optional[str]): Target column to exclude from scaling
+
+    Context Output:
+        - data (pd.DataFrame): Cleaned dataset with scaled numerical features
+        - cleaned_shape (tuple): Shape after cleaning
+        - missing_values_handled (bool): Flag indicating cleaning was performed
+        - scaler (sklearn transformer): Fitted scaler object for future use
+        - scaled_columns (list): Names of columns that were scaled
+        - scaler_type (str): Type of scaler used
+
+    Example Usage:
+        # Equivalent to CleanerCrafter("mean") + ScalerCrafter("standard")
+        crafter = FusedNumericCrafter(fill="mean", scaler_type="standard")
+
+        # Or let MLFChain fuse adjacent crafters automatically
+        chain = MLFChain(CleanerCrafter("mean"), ScalerCrafter("standard")).optimize()
+
+    Workflow:
+        1. Clean columns that will not be scaled with CleanerCrafter
+        2. Compute fill values and observed-value statistics per scaled column
+        3. Derive the post-fill scaling parameters from those statistics
+        4. Fill and scale in one parallel numba pass on large data (NumPy otherwise)
+        5. Update context with the same keys as CleanerCrafter and ScalerCrafter
+    """
+
+    FILL_STRATEGIES = ("auto", "constant", "mean", "median")
+    SCALER_TYPES = ("standard", "minmax")
+
+    def __init__(
+        self,
+        fill: str = "mean",
+        scaler_type: str = "standard",
+        columns: Optional[List[str]] = None,
+        str_fill: str = "missing",
+        int_fill: float = 0.0,
+        category_threshold: Optional[float] = None,
+        dtype=np.float64,
+        inplace: bool = False,
+    ):
+        if fill not in self.FILL_STRATEGIES:
+            raise ValueError(f"Unsupported fill strategy for fusion: {fill}")
+        if scaler_type.lower() not in self.SCALER_TYPES:
+            raise ValueError(f"Unsupported scaler type for fusion: {scaler_type}")
+
+        self.fill = fill
+        self.scaler_type = scaler_type.lower()
+        self.columns = columns
+        self.int_fill = int_fill
+        self.dtype = np.dtype(dtype)
+        self.inplace = inplace
+        self.cleaner = CleanerCrafter(
+            strategy=fill,
+            str_fill=str_fill,
+            int_fill=int_fill,
+            category_threshold=category_threshold,
+            inplace=True,
+        )
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"Unsupported scaler dtype: {self.dtype}")
+
+    @classmethod
+    def can_fuse(cls, cleaner, scaler) -> bool:
+        """Check whether a CleanerCrafter followed by a ScalerCrafter can be fused"""
+        return (
+            type(cleaner) is CleanerCrafter
+            and type(scaler) is ScalerCrafter
+            and cleaner.strategy in cls.FILL_STRATEGIES
+            and scaler.scaler_type in cls.SCALER_TYPES
+            and scaler.columns != []
+        )
+
+    @classmethod
+    def from_crafters(cls, cleaner, scaler) -> "FusedNumericCrafter":
+        """Build the fused equivalent of a CleanerCrafter and ScalerCrafter pair"""
+        return cls(
+            fill=cleaner.strategy,
+            scaler_type=scaler.scaler_type,
+            columns=scaler.columns,
+            str_fill=cleaner.str_fill,
+            int_fill=cleaner.int_fill,
+            category_threshold=cleaner.category_threshold,
+            dtype=scaler.dtype,
+            # The fused crafter receives the cleaner's input, not the scaler's
+            inplace=cleaner.inplace,
+        )
+
+    def run(self, context: dict) -> dict:
+        """
+        Fill missing values and scale numerical features in one pass
+        Args:
+            context: Pipeline context dict with 'data' key
+        Returns:
+            Updated context with cleaned and scaled data and scaler object
+        """
+        logger.info("Starting fused cleaning and scaling...")
+        logger.info(f"Fill strategy: {self.fill}, scaler type: {self.scaler_type}")
+
+        if "data" not in context:
+            logger.error("No data found in context")
+            raise ValueError("No data found in context. Run DataIngestCrafter first.")
+
+        df = context["data"]
+        logger.info(f"Input data shape: {df.shape}")
+
+        columns_to_scale = self.columns
+        if columns_to_scale is None:
+            target_col = context.get("target_column")
+            columns_to_scale = _numerical_columns(df, exclude=target_col)
+        missing_cols = [col for col in columns_to_scale if col not in df.columns]
+        if missing_cols:
+            logger.error(f"Columns not found in data: {missing_cols}")
+            raise ValueError(f"Columns {missing_cols} not found in data")
+
+        inplace = self.inplace or context.get("_owns_data", False)
+        df_out = df if inplace else df.copy()
+
+        # Columns that are only cleaned go through the regular CleanerCrafter
+        other_cols = df.columns.difference(columns_to_scale, sort=False)
+        handled = False
+        if len(other_cols):
+            cleaned = self.cleaner.run({"data": select_columns(df_out, other_cols)})
+            handled = cleaned["missing_values_handled"]
+            if handled:
+                df_out[other_cols] = cleaned["data"]
+
+        scaler = None
+        if columns_to_scale:
+            arr = df_out[columns_to_scale].to_numpy(dtype=self.dtype, copy=True)
+            filled, stats = self._fill_and_scale(arr)
+            handled = handled or filled
+            df_out[columns_to_scale] = arr
+            scaler = self._build_scaler(stats, columns_to_scale, len(arr))
+            logger.info(f"Scaling completed for {len(columns_to_scale)} columns")
+        else:
+            logger.warning("No columns to scale found")
+
+        # Update context
+        context["data"] = df_out
+        context["missing_values_handled"] = handled
+        if handled:
+            context["cleaned_shape"] = df_out.shape
+        context["scaler"] = scaler
+        context["scaled_columns"] = columns_to_scale
+        context["scaler_type"] = self.scaler_type
+
+        logger.info("Fused cleaning and scaling completed successfully")
+        return context
+
+    def _fill_and_scale(self, arr: np.ndarray) -> Tuple[bool, dict]:
+        """
+        Fill and scale arr in place
+        Args:
+            arr: 2D float array of the columns to scale
+        Returns:
+            Whether any missing value was filled, and the fitted scaling statistics
+        """
+        n = arr.shape[0]
+        observed = n - np.isnan(arr).sum(axis=0)
+        filled = bool((observed < n).any())
+
+        # Statistics of the observed values, accumulated in float64
+        obs_mean = np.nanmean(arr, axis=0, dtype=np.float64)
+        if self.fill == "mean":
+            fills = obs_mean
+        elif self.fill == "median":
+            fills = np.nanmedian(arr, axis=0).astype(np.float64)
+        else:
+            fills = np.full(arr.shape[1], self.int_fill, dtype=np.float64)
+
+        if self.scaler_type == "standard":
+            # Mean and variance of the filled column from the observed statistics:
+            # k observed values plus (n - k) copies of the fill value
+            obs_var = np.nanvar(arr, axis=0, dtype=np.float64)
+            mean = (observed * obs_mean + (n - observed) * fills) / n
+            var = (
+                observed * (obs_var + (obs_mean - mean) ** 2)
+                + (n - observed) * (fills - mean) ** 2
+            ) / n
+            stats = {"mean": mean, "var": var}
+            scale = np.sqrt(var)
+            offsets = mean
+        else:
+            data_min = np.nanmin(arr, axis=0).astype(np.float64)
+            data_max = np.nanmax(arr, axis=0).astype(np.float64)
+            has_fill = observed < n
+            data_min = np.where(has_fill, np.minimum(data_min, fills), data_min)
+            data_max = np.where(has_fill, np.maximum(data_max, fills), data_max)
+            stats = {"data_min": data_min, "data_max": data_max}
+            scale = data_max - data_min
+            offsets = data_min
+        scale[scale == 0.0] = 1.0  # Constant columns, as sklearn does
+        stats["scale"] = scale
+
+        fills = fills.astype(arr.dtype)
+        offsets = offsets.astype(arr.dtype)
+        scales = (1.0 / scale).astype(arr.dtype)
+        if _HAS_NUMBA and arr.size >= _NUMBA_MIN_CELLS:
+            from ._numba_kernels import fill_and_scale_2d
+
+            logger.debug("Filling and scaling with numba kernel")
+            fill_and_scale_2d(arr, fills, offsets, scales)
+        else:
+            np.copyto(arr, fills, where=np.isnan(arr))
+            arr -= offsets
+            arr *= scales
+        return filled, stats
+
+    def _build_scaler(self, stats: dict, columns: List[str], n_samples: int):
+        """Build a fitted sklearn scaler matching the fused statistics"""
+        if self.scaler_type == "standard":
+            scaler = StandardScaler()
+            scaler.mean_ = stats["mean"]
+            scaler.var_ = stats["var"]
+            scaler.scale_ = stats["scale"]
+        else:
+            scaler = MinMaxScaler()
+            scaler.data_min_ = stats["data_min"]
+            scaler.data_max_ = stats["data_max"]
+            scaler.data_range_ = stats["data_max"] - stats["data_min"]
+            scaler.scale_ = 1.0 / stats["scale"]
+            scaler.min_ = -stats["data_min"] * scaler.scale_
+        scaler.n_samples_seen_ = n_samples
+        scaler.n_features_in_ = len(columns)
+        # sklearn only records names when every column label is a string
+        if all(isinstance(col, str) for col in columns):
+            scaler.feature_names_in_ = np.asarray(columns, dtype=object)
+        return scaler
@@ -2,12 +2,31 @@ import logging
 from typing import List, Optional
 
 import numpy as np
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
 
 # Setup logger for this crafter
 logger = logging.getLogger("mlfcrafter.ScalerCrafter")
 
 
+def _numerical_columns(df, exclude=None) -> List:
+    """
+    Names of the numerical columns of df, without exclude
+    Args:
+        df: DataFrame to inspect
+        exclude: Optional column name to leave out (e.g. the target)
+    Returns:
+        List of numerical column names in frame order
+    """
+    # Scan the dtypes instead of select_dtypes, which copies the selected columns
+    # before pandas 3. Booleans are not scaled, as with select_dtypes(np.number)
+    return [
+        col
+        for col, dtype in df.dtypes.items()
+        if col != exclude and is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+    ]
+
+
 class ScalerCrafter:
     """
     Data Scaling Crafter for numerical feature normalization.
@@ -17,14 +36,27 @@ class ScalerCrafter:
     such as logistic regression, SVM, and neural networks.
 
     Parameters:
-        scaler_type (str): Type of scaling technique. Options:
+        scaler_type (Optional[str]): Type of scaling technique. Options:
             - "minmax": MinMaxScaler - scales features to [0,1] range
             - "standard": StandardScaler - standardizes features (mean=0, std=1)
             - "robust": RobustScaler - uses median and IQR, robust to outliers
+            - None: Disable scaling, data passes through unchanged
 
         columns (Optional[List[str]]): Specific columns to scale.
             - None: Auto-select all numerical columns (default)
             - List of column names: Scale only specified columns
+            - Empty list: Disable scaling, data passes through unchanged
+
+        dtype (numpy dtype): Floating point precision of the scaled columns.
+            - np.float64: Full precision (default)
+            - np.float32: Halves memory traffic and doubles SIMD width, which
+              roughly halves scaling time on large frames. Results keep about
+              7 significant digits, enough for tree models and neural networks
+              but not for bit-exact comparisons with float64 pipelines
+
+        inplace (bool): Scale columns directly on the input DataFrame instead of a
+            copy (default: False). Inside an MLFChain the incoming frame is owned
+            by the chain, so the copy is skipped automatically.
 
     Context Input:
         - data (pd.DataFrame): Dataset to scale (required)
@@ -64,10 +96,18 @@ class ScalerCrafter:
     """
 
     def __init__(
-        self, scaler_type: str = "minmax", columns: Optional[List[str]] = None
+        self,
+        scaler_type: Optional[str] = "minmax",
+        columns: Optional[List[str]] = None,
+        dtype=np.float64,
+        inplace: bool = False,
     ):
-        self.scaler_type = scaler_type.lower()
+        self.scaler_type = scaler_type.lower() if scaler_type is not None else None
         self.columns = columns
+        self.dtype = np.dtype(dtype)
+        self.inplace = inplace
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"Unsupported scaler dtype: {self.dtype}")
 
     def run(self, context: dict) -> dict:
         """
@@ -84,23 +124,25 @@ class ScalerCrafter:
             logger.error("No data found in context")
             raise ValueError("No data found in context. Run DataIngestCrafter first.")
 
-        df = context["data"]
-        df_scaled = df.copy()
+        # Optional step in programmatically built chains, skip before any scan
+        if self.scaler_type is None or self.columns == []:
+            logger.info("Scaling disabled, skipping")
+            context["scaled_columns"] = []
+            context["scaler"] = None
+            context["scaler_type"] = self.scaler_type
+            return context
 
-        logger.info(f"Input data shape: {df_scaled.shape}")
+        df = context["data"]
+        logger.info(f"Input data shape: {df.shape}")
 
         # Determine columns to scale
         columns_to_scale = self.columns
         if columns_to_scale is None:
             # Auto-select numerical columns, but exclude target column if specified in context
             target_col = context.get("target_column")
-            numerical_cols = df_scaled.select_dtypes(
-                include=[np.number]
-            ).columns.tolist()
-            if target_col and target_col in numerical_cols:
-                numerical_cols.remove(target_col)  # Don't scale target column
+            columns_to_scale = _numerical_columns(df, exclude=target_col)
+            if target_col is not None and target_col in df.columns:
                 logger.debug(f"Excluding target column '{target_col}' from scaling")
-            columns_to_scale = numerical_cols
             logger.info(
                 f"Auto-selected {len(columns_to_scale)} numerical columns for scaling"
             )
@@ -117,7 +159,7 @@ class ScalerCrafter:
         logger.debug(f"Columns to scale: {columns_to_scale}")
 
         # Validate columns exist
-        missing_cols = [col for col in columns_to_scale if col not in df_scaled.columns]
+        missing_cols = [col for col in columns_to_scale if col not in df.columns]
         if missing_cols:
             logger.error(f"Columns not found in data: {missing_cols}")
             raise ValueError(f"Columns {missing_cols} not found in data")
@@ -126,9 +168,22 @@ class ScalerCrafter:
         scaler = self._get_scaler()
         logger.info(f"Initialized {type(scaler).__name__}")
 
-        # Fit and transform the selected columns
+        inplace = self.inplace or context.get("_owns_data", False)
+        df_scaled = df if inplace else df.copy()
+
+        # Fit and transform the selected columns on a float ndarray, which lets
+        # sklearn skip its DataFrame validation and scale the buffer in place.
+        # sklearn preserves float32 input, so the columns keep self.dtype
         logger.info("Fitting scaler on selected columns...")
-        df_scaled[columns_to_scale] = scaler.fit_transform(df_scaled[columns_to_scale])
+        values = df_scaled[columns_to_scale].to_numpy(dtype=self.dtype, copy=False)
+        df_scaled[columns_to_scale] = scaler.fit_transform(values)
+
+        # Restore what a DataFrame fit would have recorded, so the exported scaler
+        # validates column names and never overwrites the caller's arrays.
+        # sklearn only records names when every column label is a string
+        if all(isinstance(col, str) for col in columns_to_scale):
+            scaler.feature_names_in_ = np.asarray(columns_to_scale, dtype=object)
+        scaler.set_params(copy=True)
 
         logger.info(f"Scaling completed for {len(columns_to_scale)} columns")
 
@@ -153,13 +208,13 @@ class ScalerCrafter:
         """Initialize and return the appropriate scaler"""
         if self.scaler_type == "minmax":
             logger.debug("Creating MinMaxScaler")
-            return MinMaxScaler()
+            return MinMaxScaler(copy=False)
         elif self.scaler_type == "standard":
             logger.debug("Creating StandardScaler")
-            return StandardScaler()
+            return StandardScaler(copy=False)
         elif self.scaler_type == "robust":
             logger.debug("Creating RobustScaler")
-            return RobustScaler()
+            return RobustScaler(copy=False)
         else:
             logger.error(f"Unsupported scaler type: {self.scaler_type}")
             raise ValueError(f"Unsupported scaler type: {self.scaler_type}")
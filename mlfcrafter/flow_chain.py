@@ -1,25 +1,79 @@
+import contextlib
+from importlib.util import find_spec
 import logging
+import operator
+import os
+import tempfile
+from typing import Optional, Set, Union
+
+from joblib import Parallel, delayed
+import pandas as pd
+
+from ._compat import select_columns
 
 # Setup logger for MLFChain
 logger = logging.getLogger("mlfcrafter.MLFChain")
 
+# Feather checkpoints are written and memory-mapped through pyarrow
+_HAS_PYARROW = find_spec("pyarrow") is not None
+
 
 class MLFChain:
     """
     Initialize MLFChain with multiple crafters
     Usage: MLFChain(DataIngestCrafter(...), CleanerCrafter(...), ...)
+
+    With checkpoint_dir set, the data frame is written to
+    checkpoint_dir/stage_<i>.feather after every crafter i, and resume_from(i)
+    continues a later run from that file instead of recomputing stages 1..i.
     """
 
-    def __init__(self, *crafters):
+    def __init__(
+        self,
+        *crafters,
+        checkpoint_dir: Optional[Union[str, os.PathLike]] = None,
+        checkpoint_compression: Optional[str] = "lz4",
+    ):
+        if checkpoint_dir is not None and not _HAS_PYARROW:
+            raise ImportError(
+                "Checkpoints require pyarrow. Install with: pip install mlfcrafter[fast]"
+            )
         self.crafters = list(crafters)
-        logger.info(f"MLFChain initialized with {len(self.crafters)} crafters")
-        for i, crafter in enumerate(self.crafters, 1):
-            logger.debug(f"Crafter {i}: {type(crafter).__name__}")
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_compression = checkpoint_compression
+        logger.info("MLFChain initialized with %d crafters", len(self.crafters))
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, crafter in enumerate(self.crafters, 1):
+                logger.debug("Crafter %d: %s", i, type(crafter).__name__)
 
     def add_crafter(self, crafter):
         """Add a single crafter to the chain"""
         self.crafters.append(crafter)
-        logger.info(f"Added {type(crafter).__name__} to chain")
+        logger.info("Added %s to chain", type(crafter).__name__)
+
+    def optimize(self):
+        """
+        Fuse adjacent crafters that can share a pass over the data
+        Replaces each CleanerCrafter directly followed by a ScalerCrafter with an
+        equivalent FusedNumericCrafter. Returns the chain for call chaining.
+        """
+        # Imported here so building a chain does not load sklearn and numba
+        from .crafters.fused_numeric_crafter import FusedNumericCrafter
+
+        optimized = []
+        for crafter in self.crafters:
+            if optimized and FusedNumericCrafter.can_fuse(optimized[-1], crafter):
+                fused = FusedNumericCrafter.from_crafters(optimized[-1], crafter)
+                logger.info(
+                    "Fused %s and %s into FusedNumericCrafter",
+                    type(optimized[-1]).__name__,
+                    type(crafter).__name__,
+                )
+                optimized[-1] = fused
+            else:
+                optimized.append(crafter)
+        self.crafters = optimized
+        return self
 
     def run(self, target_column=None, **kwargs):
         """
@@ -28,20 +82,85 @@ class MLFChain:
             target_column: Target column name for ML tasks
             **kwargs: Additional parameters to pass to the first crafter
         """
+        context = {"data": None, "target_column": target_column, **kwargs}
+        return self._run_crafters(context, start=0)
+
+    def resume_from(self, stage, target_column=None, **kwargs):
+        """
+        Run the chain from a checkpoint, skipping the crafters it covers
+        Args:
+            stage: Number of the last completed crafter (1-based), whose
+                checkpoint holds the data to continue from
+            target_column: Target column name for ML tasks
+            **kwargs: Additional context parameters, as in run()
+        """
+        if self.checkpoint_dir is None:
+            raise ValueError("resume_from requires a chain with checkpoint_dir set")
+        stage = operator.index(stage)  # Accept any integer type, e.g. np.int64
+        if not 1 <= stage <= len(self.crafters):
+            raise ValueError(
+                f"Stage must be between 1 and {len(self.crafters)}, got {stage}"
+            )
+
+        from pyarrow import feather
+
+        path = self._checkpoint_path(self.checkpoint_dir, stage)
+        logger.info("Resuming after stage %d from %s", stage, path)
+        # Memory-mapped columns are read-only, the context must not own them
+        data = feather.read_feather(path, memory_map=True)
+        context = {"data": data, "target_column": target_column, **kwargs}
+        return self._run_crafters(context, start=stage)
+
+    @staticmethod
+    def _checkpoint_path(checkpoint_dir: Union[str, os.PathLike], stage: int) -> str:
+        return os.path.join(checkpoint_dir, f"stage_{stage}.feather")
+
+    def _write_checkpoint(
+        self, checkpoint_dir: Union[str, os.PathLike], stage: int, data: pd.DataFrame
+    ) -> None:
+        """Write the data after a stage, a failed write only logs a warning"""
+        path = self._checkpoint_path(checkpoint_dir, stage)
+        tmp_path: Optional[str] = None
+        try:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+            # Write next to the target and rename, so the checkpoint is never partial
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f"stage_{stage}.", suffix=".tmp", dir=checkpoint_dir
+            )
+            os.close(fd)
+            data.to_feather(tmp_path, compression=self.checkpoint_compression)
+            os.replace(tmp_path, path)
+            logger.debug("Checkpoint written to %s", path)
+        except Exception as e:
+            logger.warning("Could not write checkpoint %s: %s", path, e)
+            # A checkpoint from an earlier run would no longer match this stage
+            for leftover in (tmp_path, path):
+                if leftover is not None:
+                    with contextlib.suppress(OSError):
+                        os.remove(leftover)
+
+    def _run_crafters(self, context: dict, start: int) -> dict:
+        """Run the crafters after the first start ones on context"""
         logger.info("=" * 50)
         logger.info("STARTING MLFCrafter PIPELINE")
         logger.info("=" * 50)
 
-        if target_column:
-            logger.info(f"Target column: {target_column}")
+        if context["target_column"]:
+            logger.info("Target column: %s", context["target_column"])
 
-        # Initialize context
-        context = {"data": None, "target_column": target_column, **kwargs}
+        # Frames produced inside the chain are never reused once the next crafter
+        # replaces them, so crafters may modify them in place instead of copying
+        caller_data = context["data"]
+        context["_owns_data"] = False
+
+        n = len(self.crafters)
+        names = [type(crafter).__name__ for crafter in self.crafters]
+        checkpoint_dir = self.checkpoint_dir
 
         # Execute each crafter in sequence
-        for i, crafter in enumerate(self.crafters, 1):
-            crafter_name = type(crafter).__name__
-            logger.info(f"[{i}/{len(self.crafters)}] Running {crafter_name}...")
+        for i in range(start + 1, n + 1):
+            crafter, crafter_name = self.crafters[i - 1], names[i - 1]
+            logger.info("[%d/%d] Running %s...", i, n, crafter_name)
 
             try:
                 context = crafter.run(context)
@@ -49,20 +168,104 @@ class MLFChain:
                     raise TypeError(
                         f"Crafter {i} ({crafter_name}) must return a dict (context)."
                     )
-                logger.info(
-                    f"[{i}/{len(self.crafters)}] {crafter_name} completed successfully"
-                )
+                context["_owns_data"] = context.get("data") is not caller_data
+                logger.info("[%d/%d] %s completed successfully", i, n, crafter_name)
 
             except Exception as e:
-                logger.error(
-                    f"[{i}/{len(self.crafters)}] {crafter_name} failed: {str(e)}"
-                )
+                logger.error("[%d/%d] %s failed: %s", i, n, crafter_name, e)
                 raise RuntimeError(
                     f"Error in crafter {i} ({crafter_name}): {str(e)}"
                 ) from e
 
+            if checkpoint_dir is not None and isinstance(
+                context.get("data"), pd.DataFrame
+            ):
+                self._write_checkpoint(checkpoint_dir, i, context["data"])
+
+        context.pop("_owns_data", None)
+
         logger.info("=" * 50)
         logger.info("MLFCrafter PIPELINE COMPLETED SUCCESSFULLY")
         logger.info("=" * 50)
 
         return context
+
+
+class ParallelGroup:
+    """
+    Run crafters on disjoint column subsets concurrently inside a MLFChain
+    Usage: ParallelGroup((ScalerCrafter(...), ["age", "income"]),
+                         (CategoricalCrafter(...), ["city"]))
+
+    Each branch is a (crafter, columns) pair. Every crafter receives a copy of
+    the context whose data holds only its columns, all branches run on a thread
+    pool, and the resulting frames are joined back on the shared row index.
+    Other context keys written by the branches are merged in branch order.
+    """
+
+    def __init__(self, *branches, n_jobs: Optional[int] = -1):
+        self.crafters = [crafter for crafter, _ in branches]
+        self.columns = [list(columns) for _, columns in branches]
+        self.n_jobs = n_jobs
+
+        seen: Set[str] = set()
+        for columns in self.columns:
+            overlap = seen.intersection(columns)
+            if overlap:
+                raise ValueError(
+                    f"Columns {sorted(overlap)} assigned to more than one branch"
+                )
+            seen.update(columns)
+
+    def run(self, context: dict) -> dict:
+        """
+        Run every branch on its column subset and merge the results
+        Args:
+            context: Pipeline context dict with 'data' key
+        Returns:
+            Updated context with merged data and branch outputs
+        """
+        if context.get("data") is None:
+            raise ValueError("No data found in context. Run DataIngestCrafter first.")
+
+        df = context["data"]
+        grouped = [col for columns in self.columns for col in columns]
+        missing_cols = [col for col in grouped if col not in df.columns]
+        if missing_cols:
+            raise ValueError(f"Columns {missing_cols} not found in data")
+
+        # Every branch gets its own frame, so branches may modify it in place
+        subcontexts = [
+            {**context, "data": select_columns(df, columns), "_owns_data": True}
+            for columns in self.columns
+        ]
+        logger.info("Running %d crafters in parallel", len(self.crafters))
+        results = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(crafter.run)(sub_context)
+            for crafter, sub_context in zip(self.crafters, subcontexts)
+        )
+
+        frames = [df.drop(columns=grouped)]
+        for crafter, result in zip(self.crafters, results):
+            if not isinstance(result, dict):
+                raise TypeError(
+                    f"{type(crafter).__name__} must return a dict (context)."
+                )
+            if not result["data"].index.equals(df.index):
+                raise ValueError(
+                    f"{type(crafter).__name__} changed the row index, "
+                    "row-wise crafters cannot run in a ParallelGroup"
+                )
+            frames.append(result["data"])
+            context.update(
+                (key, value)
+                for key, value in result.items()
+                if key not in ("data", "_owns_data")
+            )
+
+        merged = pd.concat(frames, axis=1)
+        if set(merged.columns) == set(df.columns):
+            merged = merged[df.columns]  # Restore original column order
+
+        context["data"] = merged
+        return context
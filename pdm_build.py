@@ -0,0 +1,39 @@
+"""
+MLFCrafter Build Hook
+=====================
+
+Optionally compiles the interpreter-bound driver modules to C extensions with
+mypyc. Set MLFCRAFTER_USE_MYPYC=1 and install mypy and setuptools in the build
+environment (e.g. `pip install mypy setuptools && MLFCRAFTER_USE_MYPYC=1
+python -m build --wheel --no-isolation`). The pure Python sources are always
+shipped, but the compiled classes are native classes: parameter annotations are
+enforced at runtime, instances accept no attributes beyond those set in
+__init__, and they cannot be subclassed from Python code.
+"""
+
+import os
+
+# Modules whose cost is Python-level dispatch rather than NumPy work. Modules
+# containing numba kernels are excluded, mypyc would compile away the kernels
+MYPYC_MODULES = [
+    "mlfcrafter/flow_chain.py",
+    "mlfcrafter/crafters/data_ingest_crafter.py",
+]
+
+
+def _mypyc_enabled() -> bool:
+    return os.getenv("MLFCRAFTER_USE_MYPYC", "0").lower() in ("1", "true", "yes")
+
+
+def pdm_build_initialize(context):
+    if context.target == "wheel" and _mypyc_enabled():
+        context.config.build_config["run-setuptools"] = True
+        context.config.build_config["is-purelib"] = False
+
+
+def pdm_build_update_setup_kwargs(context, kwargs):
+    from mypyc.build import mypycify
+
+    # pandas, sklearn and joblib ship without stubs, they stay dynamically typed
+    mypy_args = ["--ignore-missing-imports", "--follow-imports=silent"]
+    kwargs["ext_modules"] = mypycify(mypy_args + MYPYC_MODULES, opt_level="3")
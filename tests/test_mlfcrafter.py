@@ -22,8 +22,10 @@ from mlfcrafter import (
     CleanerCrafter,
     DataIngestCrafter,
     DeployCrafter,
+    FusedNumericCrafter,
     MLFChain,
     ModelCrafter,
+    ParallelGroup,
     ScalerCrafter,
     ScorerCrafter,
 )
@@ -84,6 +86,13 @@ class TestDataIngestCrafter(TestDatasets):
         assert result["data"].shape == (150, 5)  # Iris dataset shape
         assert "original_shape" in result
 
+    def test_path_object_ingestion(self, temp_csv_file):
+        """Test data_path accepts pathlib.Path objects"""
+        crafter = DataIngestCrafter(data_path=Path(temp_csv_file))
+        result = crafter.run({})
+
+        assert result["data"].shape == (150, 5)
+
     def test_auto_detection(self, temp_csv_file):
         """Test automatic format detection"""
         crafter = DataIngestCrafter(data_path=temp_csv_file, source_type="auto")
@@ -92,6 +101,66 @@ class TestDataIngestCrafter(TestDatasets):
 
         assert result["data"].shape[0] > 0
 
+    def test_csv_engines_match(self, temp_csv_file):
+        """Test the default and PyArrow CSV engines load identical numeric data"""
+        pytest.importorskip("pyarrow")
+        default = DataIngestCrafter(data_path=temp_csv_file).run({})["data"]
+        arrow = DataIngestCrafter(data_path=temp_csv_file, engine="pyarrow").run({})
+
+        pd.testing.assert_frame_equal(default, arrow["data"])
+
+    def test_default_csv_engine_keeps_date_strings(self, tmp_path):
+        """Test date columns stay strings unless the PyArrow engine is chosen"""
+        csv_path = tmp_path / "dates.csv"
+        pd.DataFrame(
+            {
+                "value": [1.0, 2.0],
+                "day": ["2020-01-01", "2020-01-02"],
+                "stamp": ["2020-01-01 10:00:00", "2020-01-02 10:00:00"],
+            }
+        ).to_csv(csv_path, index=False)
+
+        data = DataIngestCrafter(data_path=str(csv_path)).run({})["data"]
+
+        assert pd.api.types.is_string_dtype(data["day"])
+        assert pd.api.types.is_string_dtype(data["stamp"])
+        assert data.loc[0, "day"] == "2020-01-01"
+
+    def test_json_lines_ingestion(self, iris_dataset, tmp_path):
+        """Test JSON Lines file ingestion"""
+        jsonl_path = tmp_path / "test_data.jsonl"
+        iris_dataset.to_json(jsonl_path, orient="records", lines=True)
+
+        crafter = DataIngestCrafter(data_path=str(jsonl_path))
+        result = crafter.run({})
+
+        assert result["data"].shape == (150, 5)
+
+    def test_cached_ingestion(self, temp_csv_file):
+        """Test repeated ingestion reuses the parsed file until it changes"""
+        DataIngestCrafter.clear_cache()
+        crafter = DataIngestCrafter(data_path=temp_csv_file, enable_cache=True)
+
+        first = crafter.run({})["data"]
+        first.iloc[0, 0] = -100.0  # Must not leak into the cache
+        second = crafter.run({})["data"]
+        assert second.iloc[0, 0] != -100.0
+
+        pd.DataFrame({"a": [1, 2]}).to_csv(temp_csv_file, index=False)
+        third = crafter.run({})["data"]
+        assert third.shape == (2, 1)
+
+    def test_cache_size_cap(self, temp_csv_file, monkeypatch):
+        """Test files larger than the cache cap are not kept in memory"""
+        from mlfcrafter.crafters import data_ingest_crafter
+
+        DataIngestCrafter.clear_cache()
+        monkeypatch.setattr(data_ingest_crafter, "_INGEST_CACHE_MAXBYTES", 100)
+        crafter = DataIngestCrafter(data_path=temp_csv_file, enable_cache=True)
+
+        assert crafter.run({})["data"].shape == (150, 5)
+        assert len(data_ingest_crafter._INGEST_CACHE) == 0
+
 
 class TestCleanerCrafter(TestDatasets):
     """Test suite for CleanerCrafter"""
@@ -122,6 +191,114 @@ class TestCleanerCrafter(TestDatasets):
         cleaned_data = result["data"]
         assert cleaned_data.isnull().sum().sum() == 0
 
+    def test_constant_cleaning_mixed_types(self, iris_dataset):
+        """Test constant strategy fills numeric and string columns separately"""
+        iris_dataset["species"] = iris_dataset["target"].map(
+            {0: "setosa", 1: "versicolor", 2: "virginica"}
+        )
+        iris_dataset.loc[0:5, "sepal length (cm)"] = np.nan
+        iris_dataset.loc[10:15, "species"] = np.nan
+
+        crafter = CleanerCrafter(strategy="constant", str_fill="Unknown", int_fill=-1)
+        context = {"data": iris_dataset}
+        result = crafter.run(context)
+
+        cleaned_data = result["data"]
+        assert cleaned_data.isnull().sum().sum() == 0
+        assert (cleaned_data.loc[0:5, "sepal length (cm)"] == -1).all()
+        assert (cleaned_data.loc[10:15, "species"] == "Unknown").all()
+
+    def test_categorical_cleaning(self, iris_dataset):
+        """Test string fill on categorical and low-cardinality object columns"""
+        species = iris_dataset["target"].map(
+            {0: "setosa", 1: "versicolor", 2: "virginica"}
+        )
+        iris_dataset["species"] = species.astype(object)
+        iris_dataset["species_cat"] = species.astype("category")
+        iris_dataset.loc[10:15, ["species", "species_cat"]] = np.nan
+
+        crafter = CleanerCrafter(strategy="auto", category_threshold=0.5)
+        result = crafter.run({"data": iris_dataset})
+
+        cleaned_data = result["data"]
+        assert cleaned_data.isnull().sum().sum() == 0
+        for col in ["species", "species_cat"]:
+            assert isinstance(cleaned_data[col].dtype, pd.CategoricalDtype)
+            assert (cleaned_data.loc[10:15, col] == "missing").all()
+
+    def test_numba_fill_matches_pandas(self, iris_dataset, monkeypatch):
+        """Test the in-place numba fill matches fillna, and runs where it can"""
+        pytest.importorskip("numba")
+        from mlfcrafter.crafters import _numba_kernels, cleaner_crafter
+
+        calls = []
+        kernel = _numba_kernels.fill_nan_2d
+        monkeypatch.setattr(cleaner_crafter, "_NUMBA_MIN_CELLS", 0)
+        monkeypatch.setattr(
+            _numba_kernels, "fill_nan_2d", lambda *args: calls.append(kernel(*args))
+        )
+        features = iris_dataset.drop(columns="target")
+        features.loc[0:5, "sepal length (cm)"] = np.nan
+        features.loc[10:15, "petal width (cm)"] = np.nan
+        expected = features.fillna(features.mean())
+
+        crafter = CleanerCrafter(strategy="mean")
+        result = crafter.run({"data": features})
+
+        pd.testing.assert_frame_equal(result["data"], expected)
+        # Copy-on-write (pandas 3) never exposes a writeable view of the frame
+        assert bool(calls) == (int(pd.__version__.split(".")[0]) < 3)
+
+    def test_drop_cleaning(self, iris_dataset):
+        """Test drop strategy removes every row with a missing value"""
+        iris_dataset.loc[0:5, "sepal length (cm)"] = np.nan
+        iris_dataset.loc[10:15, "petal width (cm)"] = np.nan
+
+        crafter = CleanerCrafter(strategy="drop")
+        context = {"data": iris_dataset}
+        result = crafter.run(context)
+
+        assert result["data"].shape == (138, 5)
+        assert result["cleaned_shape"] == (138, 5)
+
+    def test_drop_cleaning_keeps_index_labels(self, iris_dataset):
+        """Test drop strategy matches dropna on a non-default index"""
+        iris_dataset.loc[[3, 40, 41], "sepal width (cm)"] = np.nan
+        iris_dataset.loc[[40, 99], "petal length (cm)"] = np.nan
+        shuffled = iris_dataset.sample(frac=1.0, random_state=0)
+
+        result = CleanerCrafter(strategy="drop").run({"data": shuffled})
+
+        pd.testing.assert_frame_equal(result["data"], shuffled.dropna())
+
+    @pytest.mark.parametrize(
+        "strategy", ["auto", "mean", "median", "mode", "drop", "constant"]
+    )
+    def test_duplicate_column_names(self, strategy):
+        """Test columns sharing a name are cleaned independently"""
+        df = pd.DataFrame(
+            [[1.0, np.nan, "x"], [np.nan, 4.0, None], [3.0, 8.0, "x"]],
+            columns=["a", "a", "s"],
+        )
+        unique = df.set_axis(["a0", "a1", "s"], axis=1)
+        expected = CleanerCrafter(strategy=strategy).run({"data": unique})["data"]
+
+        result = CleanerCrafter(strategy=strategy).run({"data": df})
+
+        assert list(result["data"].columns) == ["a", "a", "s"]
+        pd.testing.assert_frame_equal(
+            result["data"].set_axis(["a0", "a1", "s"], axis=1), expected
+        )
+
+    def test_clean_frame_is_returned_unchanged(self, iris_dataset):
+        """Test a frame without missing values is passed through without a copy"""
+        crafter = CleanerCrafter(strategy="mean")
+        result = crafter.run({"data": iris_dataset})
+
+        assert result["data"] is iris_dataset
+        assert result["missing_values_handled"] is False
+        assert "cleaned_shape" not in result
+
 
 class TestScalerCrafter(TestDatasets):
     """Test suite for ScalerCrafter"""
@@ -160,6 +337,64 @@ class TestScalerCrafter(TestDatasets):
         assert "scaler" in result
         assert result["scaler_type"] == "minmax"
 
+    def test_float32_scaling(self, iris_dataset):
+        """Test scaling in single precision keeps float32 columns"""
+        crafter = ScalerCrafter(scaler_type="standard", dtype=np.float32)
+        context = {"data": iris_dataset, "target_column": "target"}
+        result = crafter.run(context)
+
+        scaled_data = result["data"]
+        for col in result["scaled_columns"]:
+            assert scaled_data[col].dtype == np.float32
+            assert abs(scaled_data[col].mean()) < 1e-5
+
+    def test_disabled_scaling(self, iris_dataset):
+        """Test scaler_type=None passes data through untouched"""
+        crafter = ScalerCrafter(scaler_type=None)
+        context = {"data": iris_dataset, "target_column": "target"}
+        result = crafter.run(context)
+
+        assert result["data"] is iris_dataset
+        assert result["scaler"] is None
+        assert result["scaled_columns"] == []
+
+    def test_auto_selects_numeric_columns(self):
+        """Test auto-selection skips the target, boolean and string columns"""
+        df = pd.DataFrame(
+            {
+                "x": [1.0, 2.0, 3.0],
+                "n": [1, 2, 3],
+                "flag": [True, False, True],
+                "name": ["a", "b", "c"],
+                "target": [0, 1, 0],
+            }
+        )
+        result = ScalerCrafter().run({"data": df, "target_column": "target"})
+
+        assert result["scaled_columns"] == ["x", "n"]
+
+    @pytest.mark.filterwarnings("error")
+    def test_integer_column_labels(self):
+        """Test the fitted scaler transforms integer-labelled frames without warnings"""
+        df = pd.DataFrame({0: [1.0, 2.0, 3.0], 1: [4.0, 6.0, 8.0]})
+        result = ScalerCrafter(scaler_type="standard").run({"data": df})
+
+        assert not hasattr(result["scaler"], "feature_names_in_")
+        result["scaler"].transform(df)
+
+    def test_scaling_preserves_input_by_default(self, iris_dataset):
+        """Test that the input frame is only modified when inplace=True"""
+        original = iris_dataset.copy()
+
+        result = ScalerCrafter(scaler_type="standard").run({"data": iris_dataset})
+        assert result["data"] is not iris_dataset
+        pd.testing.assert_frame_equal(iris_dataset, original)
+
+        result = ScalerCrafter(scaler_type="standard", inplace=True).run(
+            {"data": iris_dataset}
+        )
+        assert result["data"] is iris_dataset
+
 
 class TestCategoricalCrafter(TestDatasets):
     """Test suite for CategoricalCrafter"""
@@ -394,6 +629,180 @@ class TestEndToEndPipeline(TestDatasets):
         assert result["missing_values_handled"] is True
         assert len(result["scores"]) == 2  # Only accuracy and f1
 
+    def test_checkpoint_and_resume(self, wine_dataset, tmp_path):
+        """Test resuming a chain from a Feather checkpoint skips earlier stages"""
+        pytest.importorskip("pyarrow")
+        wine_dataset.loc[10:15, wine_dataset.columns[0]] = np.nan
+        temp_file = tmp_path / "wine_test.csv"
+        wine_dataset.to_csv(temp_file, index=False)
+        checkpoint_dir = tmp_path / "checkpoints"
+
+        chain = MLFChain(
+            DataIngestCrafter(data_path=str(temp_file)),
+            CleanerCrafter(strategy="mean"),
+            ScalerCrafter(scaler_type="standard"),
+            ModelCrafter(model_name="random_forest", model_params={"n_estimators": 10}),
+            checkpoint_dir=checkpoint_dir,
+        )
+        result = chain.run(target_column="target")
+
+        assert sorted(os.listdir(checkpoint_dir)) == [
+            f"stage_{i}.feather" for i in range(1, 5)
+        ]
+        checkpoint = pd.read_feather(checkpoint_dir / "stage_3.feather")
+        pd.testing.assert_frame_equal(checkpoint, result["data"])
+
+        # Ingest, cleaning and scaling are not run again
+        chain.crafters[0] = DataIngestCrafter(data_path=str(tmp_path / "gone.csv"))
+        resumed = chain.resume_from(np.int64(3), target_column="target")
+        assert resumed["test_score"] == result["test_score"]
+
+        with pytest.raises(ValueError, match="Stage must be between"):
+            chain.resume_from(5)
+
+    def test_failed_checkpoint_is_removed(self, iris_dataset, tmp_path):
+        """Test a failed checkpoint write leaves no partial or stale file behind"""
+        pytest.importorskip("pyarrow")
+        chain = MLFChain(CleanerCrafter(strategy="auto"), checkpoint_dir=tmp_path)
+        chain.run(data=iris_dataset)
+        assert os.listdir(tmp_path) == ["stage_1.feather"]
+
+        # Arrow cannot store an object column mixing integers and strings
+        mixed = pd.DataFrame({"a": pd.Series([1, "x", 2], dtype=object)})
+        chain.run(data=mixed)
+
+        assert os.listdir(tmp_path) == []
+        with pytest.raises(FileNotFoundError):
+            chain.resume_from(1)
+
+
+class TestFusedNumericCrafter(TestDatasets):
+    """Test suite for FusedNumericCrafter"""
+
+    @pytest.mark.parametrize("fill", ["auto", "mean", "median"])
+    @pytest.mark.parametrize("scaler_type", ["standard", "minmax"])
+    def test_matches_cleaner_and_scaler(self, wine_dataset, fill, scaler_type):
+        """Test fused output equals CleanerCrafter followed by ScalerCrafter"""
+        wine_dataset.loc[10:15, wine_dataset.columns[0]] = np.nan
+        wine_dataset.loc[20:40, wine_dataset.columns[3]] = np.nan
+
+        expected = ScalerCrafter(scaler_type=scaler_type).run(
+            CleanerCrafter(strategy=fill).run(
+                {"data": wine_dataset.copy(), "target_column": "target"}
+            )
+        )
+        crafter = FusedNumericCrafter(fill=fill, scaler_type=scaler_type)
+        result = crafter.run({"data": wine_dataset, "target_column": "target"})
+
+        pd.testing.assert_frame_equal(result["data"], expected["data"], atol=1e-12)
+        assert result["scaled_columns"] == expected["scaled_columns"]
+        assert result["missing_values_handled"] is True
+        np.testing.assert_allclose(
+            result["scaler"].scale_, expected["scaler"].scale_, rtol=1e-12
+        )
+
+    @pytest.mark.filterwarnings("error")
+    def test_cleans_unscaled_object_columns(self, iris_dataset):
+        """Test object columns are filled alongside the scaled numerical ones"""
+        iris_dataset["size"] = np.where(
+            iris_dataset["petal length (cm)"] > 4, "large", None
+        ).astype(object)
+        iris_dataset.loc[0:5, "sepal length (cm)"] = np.nan
+
+        crafter = FusedNumericCrafter(fill="auto", scaler_type="standard")
+        result = crafter.run({"data": iris_dataset, "target_column": "target"})
+
+        assert not result["data"].isnull().any().any()
+        assert (result["data"]["size"] != "large").sum() == (
+            iris_dataset["size"].isnull().sum()
+        )
+
+    def test_numpy_fallback(self, iris_dataset, monkeypatch):
+        """Test the NumPy path matches the numba kernel"""
+        from mlfcrafter.crafters import fused_numeric_crafter
+
+        iris_dataset.loc[0:5, "sepal length (cm)"] = np.nan
+        context = {"data": iris_dataset, "target_column": "target"}
+        monkeypatch.setattr(fused_numeric_crafter, "_NUMBA_MIN_CELLS", 0)
+        expected = FusedNumericCrafter().run(dict(context))["data"]
+
+        monkeypatch.setattr(fused_numeric_crafter, "_HAS_NUMBA", False)
+        result = FusedNumericCrafter().run(dict(context))["data"]
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.filterwarnings("error")
+    def test_integer_column_labels(self):
+        """Test the fused scaler transforms integer-labelled frames without warnings"""
+        df = pd.DataFrame({0: [1.0, np.nan, 3.0], 1: [4.0, 6.0, 8.0]})
+        result = FusedNumericCrafter().run({"data": df})
+
+        assert not hasattr(result["scaler"], "feature_names_in_")
+        result["scaler"].transform(df.fillna(0.0))
+
+    def test_optimize_keeps_caller_frame(self, iris_dataset):
+        """Test an inplace scaler does not make the fused crafter modify the input"""
+        iris_dataset.loc[0:5, "sepal length (cm)"] = np.nan
+        original = iris_dataset.copy()
+        chain = MLFChain(
+            CleanerCrafter(strategy="mean"),
+            ScalerCrafter(scaler_type="standard", inplace=True),
+        ).optimize()
+
+        chain.run(target_column="target", data=iris_dataset)
+
+        pd.testing.assert_frame_equal(iris_dataset, original)
+
+    def test_chain_optimize(self):
+        """Test MLFChain.optimize fuses adjacent cleaner and scaler"""
+        chain = MLFChain(
+            CleanerCrafter(strategy="mean"),
+            ScalerCrafter(scaler_type="standard"),
+            CleanerCrafter(strategy="drop"),
+            ScalerCrafter(scaler_type="robust"),
+        ).optimize()
+
+        assert [type(c).__name__ for c in chain.crafters] == [
+            "FusedNumericCrafter",
+            "CleanerCrafter",
+            "ScalerCrafter",
+        ]
+
+
+class TestParallelGroup(TestDatasets):
+    """Test suite for ParallelGroup"""
+
+    @pytest.mark.filterwarnings("error")
+    def test_parallel_branches(self, iris_dataset):
+        """Test scaling and encoding disjoint columns concurrently"""
+        iris_dataset["size"] = np.where(
+            iris_dataset["petal length (cm)"] > 4, "large", "small"
+        )
+        features = list(iris_dataset.columns[:4])
+
+        group = ParallelGroup(
+            (ScalerCrafter(scaler_type="minmax"), features),
+            (CategoricalCrafter(encoder_type="label", columns=["size"]), ["size"]),
+        )
+        result = group.run({"data": iris_dataset, "target_column": "target"})
+
+        data = result["data"]
+        assert list(data.columns) == list(iris_dataset.columns)
+        assert data[features].min().min() == 0
+        assert data[features].max().max() == 1
+        assert set(data["size"]) == {0, 1}
+        assert result["scaled_columns"] == features
+        assert result["encoded_columns"] == ["size"]
+        assert "_owns_data" not in result
+
+    def test_overlapping_columns_error(self):
+        """Test that a column cannot belong to two branches"""
+        with pytest.raises(ValueError, match="more than one branch"):
+            ParallelGroup(
+                (ScalerCrafter(), ["a", "b"]),
+                (CategoricalCrafter(), ["b"]),
+            )
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])